@@ -1,29 +1,94 @@
+import re
 import requests
 from bs4 import BeautifulSoup
 import streamlit as st
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
-import seaborn as sns
-from scipy import stats
-from scipy.signal import fftconvolve
-from joblib import Parallel, delayed
+from datetime import datetime
+from joblib import Parallel, delayed, cpu_count
 import warnings
+import time
+from io import BytesIO
+from functools import lru_cache
+from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter
-from SALib.sample.sobol import sample
-from SALib.analyze.sobol import analyze
-
-np.random.seed(50)
 
 st.set_page_config(page_title="Simulador de Emissões de tCO₂eq e Cálculo de Créditos de Carbono com Análise de Sensibilidade Global", layout="wide")
 warnings.filterwarnings("ignore", category=FutureWarning)
 pd.set_option('display.max_columns', None)
 pd.set_option('display.width', None)
 np.seterr(divide='ignore', invalid='ignore')
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['font.size'] = 10
-sns.set_style("whitegrid")
+
+@lru_cache(maxsize=4)
+def _daily_time_grid(days):
+    t = np.arange(1, days + 1, dtype=float)
+    t.setflags(write=False)
+    return t
+
+@lru_cache(maxsize=8)
+def _landfill_ch4_response(k_year, days):
+    response = -np.expm1(-k_year * _daily_time_grid(days) / 365.0)
+    response.setflags(write=False)
+    return response
+
+def _landfill_ch4_response_total(k_year, days):
+    decay_per_day = np.exp(-k_year / 365.0)
+    return days - decay_per_day * np.expm1(-k_year * days / 365.0) / np.expm1(-k_year / 365.0)
+
+def _normalized_profile(values):
+    profile = np.array(values, dtype=float)
+    profile /= profile.sum()
+    profile.setflags(write=False)
+    return profile
+
+def _kernel_from_profile(profile, length):
+    kernel = np.array([profile.get(d, 0) for d in range(1, length + 1)], dtype=float)
+    kernel.setflags(write=False)
+    return kernel
+
+def _cumulative_profile(profile):
+    cumulative = np.cumsum(profile)
+    cumulative.setflags(write=False)
+    return cumulative
+
+_PROFILE_CH4_VERMI = _normalized_profile([
+    0.02, 0.02, 0.02, 0.03, 0.03, 0.04, 0.04, 0.05, 0.05, 0.06,
+    0.07, 0.08, 0.09, 0.10, 0.09, 0.08, 0.07, 0.06, 0.05, 0.04,
+    0.03, 0.02, 0.02, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01,
+    0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005,
+    0.002, 0.002, 0.002, 0.002, 0.002, 0.001, 0.001, 0.001, 0.001, 0.001
+])
+
+_PROFILE_N2O_VERMI = _normalized_profile([
+    0.15, 0.10, 0.20, 0.05, 0.03, 0.03, 0.03, 0.04, 0.05, 0.06,
+    0.08, 0.09, 0.10, 0.08, 0.07, 0.06, 0.05, 0.04, 0.03, 0.02,
+    0.01, 0.01, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005,
+    0.002, 0.002, 0.002, 0.002, 0.002, 0.001, 0.001, 0.001, 0.001, 0.001,
+    0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001
+])
+
+_PROFILE_N2O_THERMO = _normalized_profile([
+    0.10, 0.08, 0.15, 0.05, 0.03, 0.04, 0.05, 0.07, 0.10, 0.12,
+    0.15, 0.18, 0.20, 0.18, 0.15, 0.12, 0.10, 0.08, 0.06, 0.05,
+    0.04, 0.03, 0.02, 0.02, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01,
+    0.005, 0.005, 0.005, 0.005, 0.005, 0.002, 0.002, 0.002, 0.002, 0.002,
+    0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001
+])
+
+_PROFILE_N2O_LANDFILL = {1: 0.10, 2: 0.30, 3: 0.40, 4: 0.15, 5: 0.05}
+_KERNEL_N2O_LANDFILL = _kernel_from_profile(_PROFILE_N2O_LANDFILL, 5)
+
+_PROFILE_N2O_PRE = {1: 0.8623, 2: 0.10, 3: 0.0377}
+_KERNEL_N2O_PRE = _kernel_from_profile(_PROFILE_N2O_PRE, 3)
+
+_CUMULATIVE_CH4_VERMI = _cumulative_profile(_PROFILE_CH4_VERMI)
+_CUMULATIVE_N2O_VERMI = _cumulative_profile(_PROFILE_N2O_VERMI)
+_CUMULATIVE_N2O_THERMO = _cumulative_profile(_PROFILE_N2O_THERMO)
+_CUMULATIVE_N2O_LANDFILL = _cumulative_profile(_KERNEL_N2O_LANDFILL)
+_CUMULATIVE_N2O_PRE = _cumulative_profile(_KERNEL_N2O_PRE)
 
 class GHGEmissionCalculator:
     def __init__(self):
@@ -40,40 +105,31 @@ class GHGEmissionCalculator:
         self.F = 0.5
         self.OX = 0.1
         self.Ri = 0.0
+        self._setup_emission_coefficients()
         self._load_emission_profiles()
         self._setup_pre_disposal_emissions()
     
+    def _setup_emission_coefficients(self):
+        self.CH4_YIELD_LANDFILL = self.MCF * self.F * (16/12) * (1 - self.Ri) * (1 - self.OX)
+        self.CH4_COEF_VERMI = self.TOC * self.f_CH4_vermi * (16/12)
+        self.N2O_COEF_VERMI = self.TN * self.f_N2O_vermi * (44/28)
+        self.CH4_COEF_THERMO = self.TOC * self.f_CH4_thermo * (16/12)
+        self.N2O_COEF_THERMO = self.TN * self.f_N2O_thermo * (44/28)
+    
     def _load_emission_profiles(self):
-        self.profile_ch4_vermi = np.array([
-            0.02, 0.02, 0.02, 0.03, 0.03, 0.04, 0.04, 0.05, 0.05, 0.06,
-            0.07, 0.08, 0.09, 0.10, 0.09, 0.08, 0.07, 0.06, 0.05, 0.04,
-            0.03, 0.02, 0.02, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01,
-            0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005,
-            0.002, 0.002, 0.002, 0.002, 0.002, 0.001, 0.001, 0.001, 0.001, 0.001
-        ])
-        self.profile_ch4_vermi /= self.profile_ch4_vermi.sum()
-        
-        self.profile_n2o_vermi = np.array([
-            0.15, 0.10, 0.20, 0.05, 0.03, 0.03, 0.03, 0.04, 0.05, 0.06,
-            0.08, 0.09, 0.10, 0.08, 0.07, 0.06, 0.05, 0.04, 0.03, 0.02,
-            0.01, 0.01, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005,
-            0.002, 0.002, 0.002, 0.002, 0.002, 0.001, 0.001, 0.001, 0.001, 0.001,
-            0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001
-        ])
-        self.profile_n2o_vermi /= self.profile_n2o_vermi.sum()
-        
-        self.profile_ch4_thermo = self.profile_ch4_vermi.copy()
-        
-        self.profile_n2o_thermo = np.array([
-            0.10, 0.08, 0.15, 0.05, 0.03, 0.04, 0.05, 0.07, 0.10, 0.12,
-            0.15, 0.18, 0.20, 0.18, 0.15, 0.12, 0.10, 0.08, 0.06, 0.05,
-            0.04, 0.03, 0.02, 0.02, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01,
-            0.005, 0.005, 0.005, 0.005, 0.005, 0.002, 0.002, 0.002, 0.002, 0.002,
-            0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001
-        ])
-        self.profile_n2o_thermo /= self.profile_n2o_thermo.sum()
-        
-        self.profile_n2o_landfill = {1: 0.10, 2: 0.30, 3: 0.40, 4: 0.15, 5: 0.05}
+        self.profile_ch4_vermi = _PROFILE_CH4_VERMI
+        self.profile_n2o_vermi = _PROFILE_N2O_VERMI
+        self.profile_ch4_thermo = _PROFILE_CH4_VERMI
+        self.profile_n2o_thermo = _PROFILE_N2O_THERMO
+        
+        self.profile_n2o_landfill = _PROFILE_N2O_LANDFILL
+        self.kernel_n2o_landfill = _KERNEL_N2O_LANDFILL
+        
+        self.cumulative_ch4_vermi = _CUMULATIVE_CH4_VERMI
+        self.cumulative_n2o_vermi = _CUMULATIVE_N2O_VERMI
+        self.cumulative_ch4_thermo = _CUMULATIVE_CH4_VERMI
+        self.cumulative_n2o_thermo = _CUMULATIVE_N2O_THERMO
+        self.cumulative_n2o_landfill = _CUMULATIVE_N2O_LANDFILL
     
     def _setup_pre_disposal_emissions(self):
         CH4_pre_ugC_per_kg_h = 2.78
@@ -83,20 +139,16 @@ class GHGEmissionCalculator:
         N2O_pre_mgN_per_kg_day = N2O_pre_mgN_per_kg / 3
         self.N2O_pre_kg_per_kg_day = N2O_pre_mgN_per_kg_day * (44/28) / 1_000_000
         
-        self.profile_n2o_pre = {1: 0.8623, 2: 0.10, 3: 0.0377}
+        self.profile_n2o_pre = _PROFILE_N2O_PRE
+        self.kernel_n2o_pre = _KERNEL_N2O_PRE
+        self.cumulative_n2o_pre = _CUMULATIVE_N2O_PRE
     
-    def calculate_landfill_emissions(self, waste_kg_day, k_year, temperature_C, doc_fraction, moisture_fraction, years=20):
-        days = years * 365
+    def _landfill_ch4_potential_daily(self, waste_kg_day, temperature_C, doc_fraction):
         docf = 0.0147 * temperature_C + 0.28
-        ch4_potential_per_kg = (doc_fraction * docf * self.MCF * self.F * (16/12) * (1 - self.Ri) * (1 - self.OX))
-        ch4_potential_daily = waste_kg_day * ch4_potential_per_kg
-        
-        t = np.arange(1, days + 1, dtype=float)
-        kernel_ch4 = np.exp(-k_year * (t - 1) / 365.0) - np.exp(-k_year * t / 365.0)
-        daily_inputs = np.ones(days, dtype=float)
-        ch4_emissions = fftconvolve(daily_inputs, kernel_ch4, mode='full')[:days]
-        ch4_emissions *= ch4_potential_daily
-        
+        ch4_potential_per_kg = doc_fraction * docf * self.CH4_YIELD_LANDFILL
+        return waste_kg_day * ch4_potential_per_kg
+    
+    def _landfill_n2o_daily(self, waste_kg_day, moisture_fraction):
         exposed_mass = 100
         exposed_hours = 8
         opening_factor = (exposed_mass / waste_kg_day) * (exposed_hours / 24)
@@ -109,10 +161,15 @@ class GHGEmissionCalculator:
         moisture_factor = (1 - moisture_fraction) / (1 - 0.55)
         E_avg_adjusted = E_avg * moisture_factor
         
-        daily_n2o_kg = (E_avg_adjusted * (44/28) / 1_000_000) * waste_kg_day
+        return (E_avg_adjusted * (44/28) / 1_000_000) * waste_kg_day
+    
+    def calculate_landfill_emissions(self, waste_kg_day, k_year, temperature_C, doc_fraction, moisture_fraction, years=20):
+        days = years * 365
+        ch4_potential_daily = self._landfill_ch4_potential_daily(waste_kg_day, temperature_C, doc_fraction)
+        ch4_emissions = ch4_potential_daily * _landfill_ch4_response(k_year, days)
         
-        kernel_n2o = np.array([self.profile_n2o_landfill.get(d, 0) for d in range(1, 6)], dtype=float)
-        n2o_emissions = fftconvolve(np.full(days, daily_n2o_kg), kernel_n2o, mode='full')[:days]
+        daily_n2o_kg = self._landfill_n2o_daily(waste_kg_day, moisture_fraction)
+        n2o_emissions = daily_n2o_kg * self._constant_input_response(self.cumulative_n2o_landfill, days)
         
         ch4_pre, n2o_pre = self._calculate_pre_disposal(waste_kg_day, days)
         
@@ -120,54 +177,41 @@ class GHGEmissionCalculator:
     
     def _calculate_pre_disposal(self, waste_kg_day, days):
         ch4_emissions = np.full(days, waste_kg_day * self.CH4_pre_kg_per_kg_day)
-        n2o_emissions = np.zeros(days)
-        
-        for entry_day in range(days):
-            for days_after, fraction in self.profile_n2o_pre.items():
-                emission_day = entry_day + days_after - 1
-                if emission_day < days:
-                    n2o_emissions[emission_day] += (waste_kg_day * self.N2O_pre_kg_per_kg_day * fraction)
+        n2o_emissions = (waste_kg_day * self.N2O_pre_kg_per_kg_day) * self._constant_input_response(self.cumulative_n2o_pre, days)
         
         return ch4_emissions, n2o_emissions
     
+    def _constant_input_response(self, cumulative, days):
+        return cumulative[np.minimum(np.arange(days), len(cumulative) - 1)]
+    
+    def _constant_input_total(self, cumulative, days):
+        return cumulative[:days].sum() + max(days - len(cumulative), 0) * cumulative[-1]
+    
+    def _composting_per_batch(self, waste_kg_day, moisture_fraction, ch4_coef, n2o_coef):
+        dry_waste_kg_day = waste_kg_day * (1 - moisture_fraction)
+        return dry_waste_kg_day * ch4_coef, dry_waste_kg_day * n2o_coef
+    
     def calculate_vermicomposting_emissions(self, waste_kg_day, moisture_fraction, years=20):
         days = years * 365
-        dry_fraction = 1 - moisture_fraction
-        
-        ch4_per_batch = (waste_kg_day * self.TOC * self.f_CH4_vermi * (16/12) * dry_fraction)
-        n2o_per_batch = (waste_kg_day * self.TN * self.f_N2O_vermi * (44/28) * dry_fraction)
+        ch4_per_batch, n2o_per_batch = self._composting_per_batch(waste_kg_day, moisture_fraction, self.CH4_COEF_VERMI, self.N2O_COEF_VERMI)
         
-        ch4_emissions = np.zeros(days)
-        n2o_emissions = np.zeros(days)
-        
-        for entry_day in range(days):
-            for compost_day in range(self.COMPOSTING_DAYS):
-                emission_day = entry_day + compost_day
-                if emission_day < days:
-                    ch4_emissions[emission_day] += ch4_per_batch * self.profile_ch4_vermi[compost_day]
-                    n2o_emissions[emission_day] += n2o_per_batch * self.profile_n2o_vermi[compost_day]
+        ch4_emissions = ch4_per_batch * self._constant_input_response(self.cumulative_ch4_vermi, days)
+        n2o_emissions = n2o_per_batch * self._constant_input_response(self.cumulative_n2o_vermi, days)
         
         return ch4_emissions, n2o_emissions
     
     def calculate_thermophilic_emissions(self, waste_kg_day, moisture_fraction, years=20):
         days = years * 365
-        dry_fraction = 1 - moisture_fraction
-        
-        ch4_per_batch = (waste_kg_day * self.TOC * self.f_CH4_thermo * (16/12) * dry_fraction)
-        n2o_per_batch = (waste_kg_day * self.TN * self.f_N2O_thermo * (44/28) * dry_fraction)
-        
-        ch4_emissions = np.zeros(days)
-        n2o_emissions = np.zeros(days)
+        ch4_per_batch, n2o_per_batch = self._composting_per_batch(waste_kg_day, moisture_fraction, self.CH4_COEF_THERMO, self.N2O_COEF_THERMO)
         
-        for entry_day in range(days):
-            for compost_day in range(self.COMPOSTING_DAYS):
-                emission_day = entry_day + compost_day
-                if emission_day < days:
-                    ch4_emissions[emission_day] += ch4_per_batch * self.profile_ch4_thermo[compost_day]
-                    n2o_emissions[emission_day] += n2o_per_batch * self.profile_n2o_thermo[compost_day]
+        ch4_emissions = ch4_per_batch * self._constant_input_response(self.cumulative_ch4_thermo, days)
+        n2o_emissions = n2o_per_batch * self._constant_input_response(self.cumulative_n2o_thermo, days)
         
         return ch4_emissions, n2o_emissions
     
+    def _co2eq_t(self, ch4_kg, n2o_kg):
+        return (ch4_kg * self.GWP_CH4_20 + n2o_kg * self.GWP_N2O_20) / 1000
+    
     def calculate_avoided_emissions(self, waste_kg_day, k_year, temperature_C, doc_fraction, moisture_fraction, years=20):
         ch4_landfill, n2o_landfill = self.calculate_landfill_emissions(
             waste_kg_day, k_year, temperature_C, doc_fraction, moisture_fraction, years
@@ -181,44 +225,141 @@ class GHGEmissionCalculator:
             waste_kg_day, moisture_fraction, years
         )
         
-        baseline_co2eq = (ch4_landfill * self.GWP_CH4_20 + n2o_landfill * self.GWP_N2O_20) / 1000
-        vermi_co2eq = (ch4_vermi * self.GWP_CH4_20 + n2o_vermi * self.GWP_N2O_20) / 1000
-        thermo_co2eq = (ch4_thermo * self.GWP_CH4_20 + n2o_thermo * self.GWP_N2O_20) / 1000
+        ch4_landfill_kg, n2o_landfill_kg = ch4_landfill.sum(), n2o_landfill.sum()
+        ch4_vermi_kg, n2o_vermi_kg = ch4_vermi.sum(), n2o_vermi.sum()
+        ch4_thermo_kg, n2o_thermo_kg = ch4_thermo.sum(), n2o_thermo.sum()
+        
+        baseline_co2eq = self._co2eq_t(ch4_landfill_kg, n2o_landfill_kg)
+        vermi_co2eq = self._co2eq_t(ch4_vermi_kg, n2o_vermi_kg)
+        thermo_co2eq = self._co2eq_t(ch4_thermo_kg, n2o_thermo_kg)
         
-        avoided_vermi = baseline_co2eq.sum() - vermi_co2eq.sum()
-        avoided_thermo = baseline_co2eq.sum() - thermo_co2eq.sum()
+        avoided_vermi = baseline_co2eq - vermi_co2eq
+        avoided_thermo = baseline_co2eq - thermo_co2eq
         
         results = {
             'baseline': {
-                'ch4_kg': ch4_landfill.sum(),
-                'n2o_kg': n2o_landfill.sum(),
-                'co2eq_t': baseline_co2eq.sum()
+                'ch4_kg': ch4_landfill_kg,
+                'n2o_kg': n2o_landfill_kg,
+                'co2eq_t': baseline_co2eq,
+                'ch4_daily': ch4_landfill,
+                'n2o_daily': n2o_landfill
             },
             'vermicomposting': {
-                'ch4_kg': ch4_vermi.sum(),
-                'n2o_kg': n2o_vermi.sum(),
-                'co2eq_t': vermi_co2eq.sum(),
-                'avoided_co2eq_t': avoided_vermi
+                'ch4_kg': ch4_vermi_kg,
+                'n2o_kg': n2o_vermi_kg,
+                'co2eq_t': vermi_co2eq,
+                'avoided_co2eq_t': avoided_vermi,
+                'ch4_daily': ch4_vermi,
+                'n2o_daily': n2o_vermi
             },
             'thermophilic': {
-                'ch4_kg': ch4_thermo.sum(),
-                'n2o_kg': n2o_thermo.sum(),
-                'co2eq_t': thermo_co2eq.sum(),
-                'avoided_co2eq_t': avoided_thermo
+                'ch4_kg': ch4_thermo_kg,
+                'n2o_kg': n2o_thermo_kg,
+                'co2eq_t': thermo_co2eq,
+                'avoided_co2eq_t': avoided_thermo,
+                'ch4_daily': ch4_thermo,
+                'n2o_daily': n2o_thermo
             },
             'comparison': {
                 'difference_tco2eq': avoided_vermi - avoided_thermo,
                 'superiority_percent': ((avoided_vermi / avoided_thermo) - 1) * 100 if avoided_thermo != 0 else 0
             },
             'annual_averages': {
-                'baseline_tco2eq_year': baseline_co2eq.sum() / years,
+                'baseline_tco2eq_year': baseline_co2eq / years,
                 'vermi_avoided_year': avoided_vermi / years,
                 'thermo_avoided_year': avoided_thermo / years
             }
         }
         
         return results
+    
+    def _landfill_totals_kg(self, waste_kg_day, k_year, temperature_C, doc_fraction, moisture_fraction, days):
+        ch4_pre_kg = waste_kg_day * self.CH4_pre_kg_per_kg_day * days
+        n2o_pre_kg = waste_kg_day * self.N2O_pre_kg_per_kg_day * self._constant_input_total(self.cumulative_n2o_pre, days)
+        
+        ch4_landfill_kg = (self._landfill_ch4_potential_daily(waste_kg_day, temperature_C, doc_fraction)
+                           * _landfill_ch4_response_total(k_year, days) + ch4_pre_kg)
+        n2o_landfill_kg = (self._landfill_n2o_daily(waste_kg_day, moisture_fraction)
+                           * self._constant_input_total(self.cumulative_n2o_landfill, days) + n2o_pre_kg)
+        return ch4_landfill_kg, n2o_landfill_kg
+    
+    def calculate_landfill_co2eq_t_batch(self, waste_kg_day, k_year, temperature_C, doc_fraction, moisture_fraction, years=20):
+        ch4_landfill_kg, n2o_landfill_kg = self._landfill_totals_kg(
+            waste_kg_day, np.asarray(k_year, dtype=float), np.asarray(temperature_C, dtype=float),
+            np.asarray(doc_fraction, dtype=float), moisture_fraction, years * 365
+        )
+        return self._co2eq_t(ch4_landfill_kg, n2o_landfill_kg)
+    
+    def calculate_avoided_emissions_batch(self, waste_kg_day, k_year, temperature_C, doc_fraction, moisture_fraction, years=20):
+        days = years * 365
+        k_year, temperature_C, doc_fraction, moisture_fraction = np.broadcast_arrays(
+            np.asarray(k_year, dtype=float),
+            np.asarray(temperature_C, dtype=float),
+            np.asarray(doc_fraction, dtype=float),
+            np.asarray(moisture_fraction, dtype=float)
+        )
+        
+        ch4_landfill_kg, n2o_landfill_kg = self._landfill_totals_kg(
+            waste_kg_day, k_year, temperature_C, doc_fraction, moisture_fraction, days
+        )
+        
+        ch4_vermi_per_batch, n2o_vermi_per_batch = self._composting_per_batch(
+            waste_kg_day, moisture_fraction, self.CH4_COEF_VERMI, self.N2O_COEF_VERMI
+        )
+        ch4_vermi_kg = ch4_vermi_per_batch * self._constant_input_total(self.cumulative_ch4_vermi, days)
+        n2o_vermi_kg = n2o_vermi_per_batch * self._constant_input_total(self.cumulative_n2o_vermi, days)
+        
+        ch4_thermo_per_batch, n2o_thermo_per_batch = self._composting_per_batch(
+            waste_kg_day, moisture_fraction, self.CH4_COEF_THERMO, self.N2O_COEF_THERMO
+        )
+        ch4_thermo_kg = ch4_thermo_per_batch * self._constant_input_total(self.cumulative_ch4_thermo, days)
+        n2o_thermo_kg = n2o_thermo_per_batch * self._constant_input_total(self.cumulative_n2o_thermo, days)
+        
+        baseline_co2eq = self._co2eq_t(ch4_landfill_kg, n2o_landfill_kg)
+        vermi_co2eq = self._co2eq_t(ch4_vermi_kg, n2o_vermi_kg)
+        thermo_co2eq = self._co2eq_t(ch4_thermo_kg, n2o_thermo_kg)
+        
+        return {
+            'baseline': {
+                'ch4_kg': ch4_landfill_kg,
+                'n2o_kg': n2o_landfill_kg,
+                'co2eq_t': baseline_co2eq
+            },
+            'vermicomposting': {
+                'ch4_kg': ch4_vermi_kg,
+                'n2o_kg': n2o_vermi_kg,
+                'co2eq_t': vermi_co2eq,
+                'avoided_co2eq_t': baseline_co2eq - vermi_co2eq
+            },
+            'thermophilic': {
+                'ch4_kg': ch4_thermo_kg,
+                'n2o_kg': n2o_thermo_kg,
+                'co2eq_t': thermo_co2eq,
+                'avoided_co2eq_t': baseline_co2eq - thermo_co2eq
+            }
+        }
 
+PADRAO_NAO_NUMERICO = re.compile(r'[^\d.]')
+PADROES_PRECO = [
+    re.compile(r'"last":"([\d,]+)"'),
+    re.compile(r'data-last="([\d,]+)"'),
+    re.compile(r'last_price["\']?:\s*["\']?([\d,]+)'),
+    re.compile(r'value["\']?:\s*["\']?([\d,]+)')
+]
+
+@st.cache_resource
+def obter_sessao_http():
+    return requests.Session()
+
+def requisitar_com_retentativas(url, tentativas=3, **kwargs):
+    sessao = obter_sessao_http()
+    for tentativa in range(tentativas):
+        response = sessao.get(url, **kwargs)
+        if response.status_code != 429 or tentativa == tentativas - 1:
+            return response
+        time.sleep(2 ** tentativa)
+
+@st.cache_data(ttl=300, show_spinner=False)
 def obter_cotacao_carbono_investing():
     try:
         url = "https://www.investing.com/commodities/carbon-emissions"
@@ -229,10 +370,10 @@ def obter_cotacao_carbono_investing():
             'Referer': 'https://www.investing.com/'
         }
         
-        response = requests.get(url, headers=headers, timeout=15)
+        response = requisitar_com_retentativas(url, headers=headers, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         selectores = [
             '[data-test="instrument-price-last"]',
@@ -253,7 +394,7 @@ def obter_cotacao_carbono_investing():
                 elemento = soup.select_one(seletor)
                 if elemento:
                     texto_preco = elemento.text.strip().replace(',', '')
-                    texto_preco = ''.join(c for c in texto_preco if c.isdigit() or c == '.')
+                    texto_preco = PADRAO_NAO_NUMERICO.sub('', texto_preco)
                     if texto_preco:
                         preco = float(texto_preco)
                         break
@@ -263,18 +404,9 @@ def obter_cotacao_carbono_investing():
         if preco is not None:
             return preco, "€", "Carbon Emissions Future", True, fonte
         
-        import re
-        padroes_preco = [
-            r'"last":"([\d,]+)"',
-            r'data-last="([\d,]+)"',
-            r'last_price["\']?:\s*["\']?([\d,]+)',
-            r'value["\']?:\s*["\']?([\d,]+)'
-        ]
-        
-        html_texto = str(soup)
-        for padrao in padroes_preco:
-            matches = re.findall(padrao, html_texto)
-            for match in matches:
+        html_texto = response.text
+        for padrao in PADROES_PRECO:
+            for match in padrao.findall(html_texto):
                 try:
                     preco_texto = match.replace(',', '')
                     preco = float(preco_texto)
@@ -296,10 +428,11 @@ def obter_cotacao_carbono():
     
     return 85.50, "€", "Carbon Emissions (Referência)", False, "Referência"
 
+@st.cache_data(ttl=300, show_spinner=False)
 def obter_cotacao_euro_real():
     try:
         url = "https://economia.awesomeapi.com.br/last/EUR-BRL"
-        response = requests.get(url, timeout=10)
+        response = requisitar_com_retentativas(url, timeout=10)
         if response.status_code == 200:
             data = response.json()
             cotacao = float(data['EURBRL']['bid'])
@@ -309,7 +442,7 @@ def obter_cotacao_euro_real():
     
     try:
         url = "https://api.exchangerate-api.com/v4/latest/EUR"
-        response = requests.get(url, timeout=10)
+        response = requisitar_com_retentativas(url, timeout=10)
         if response.status_code == 200:
             data = response.json()
             cotacao = data['rates']['BRL']
@@ -333,6 +466,8 @@ def exibir_cotacao_carbono():
     col1, col2 = st.sidebar.columns([3, 1])
     with col1:
         if st.button("🔄 Atualizar Cotações", key="atualizar_cotacoes"):
+            obter_cotacao_carbono_investing.clear()
+            obter_cotacao_euro_real.clear()
             st.session_state.cotacao_atualizada = True
             st.session_state.mostrar_atualizacao = True
     
@@ -426,13 +561,15 @@ def inicializar_session_state():
 
 inicializar_session_state()
 
+TRADUCAO_BR = str.maketrans({',': '.', '.': ','})
+
 def formatar_br(numero):
     if pd.isna(numero):
         return "N/A"
     
     numero = round(numero, 2)
     
-    return f"{numero:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"{numero:,.2f}".translate(TRADUCAO_BR)
 
 def formatar_br_dec(numero, decimais=2):
     if pd.isna(numero):
@@ -440,7 +577,7 @@ def formatar_br_dec(numero, decimais=2):
     
     numero = round(numero, decimais)
     
-    return f"{numero:,.{decimais}f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"{numero:,.{decimais}f}".translate(TRADUCAO_BR)
 
 def br_format(x, pos):
     if x == 0:
@@ -450,9 +587,11 @@ def br_format(x, pos):
         return f"{x:.1e}".replace(".", ",")
     
     if abs(x) >= 1000:
-        return f"{x:,.0f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        return f"{x:,.0f}".translate(TRADUCAO_BR)
     
-    return f"{x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"{x:,.2f}".translate(TRADUCAO_BR)
+
+BR_FORMATTER = FuncFormatter(br_format)
 
 st.title("Simulador de Emissões de tCO₂eq e Cálculo de Créditos de Carbono com Análise de Sensibilidade Global")
 st.markdown("Esta ferramenta projeta os Créditos de Carbono ao calcular as emissões de gases de efeito estufa para dois contextos de gestão de resíduos")
@@ -526,14 +665,12 @@ with st.sidebar:
     if st.button("🚀 Executar Simulação", type="primary"):
         st.session_state.run_simulation = True
 
-def executar_simulacao_completa_sobol(params_sobol):
-    k_ano_sobol, T_sobol, DOC_sobol = params_sobol
-    
-    np.random.seed(50)
-    
+def executar_lote_sobol(params_lote, residuos_kg_dia, umidade, anos_simulacao):
     calculator = GHGEmissionCalculator()
     
-    results = calculator.calculate_avoided_emissions(
+    k_ano_sobol, T_sobol, DOC_sobol = params_lote.T
+    
+    return calculator.calculate_landfill_co2eq_t_batch(
         waste_kg_day=residuos_kg_dia,
         k_year=k_ano_sobol,
         temperature_C=T_sobol,
@@ -541,118 +678,255 @@ def executar_simulacao_completa_sobol(params_sobol):
         moisture_fraction=umidade,
         years=anos_simulacao
     )
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def avaliar_aterro_sobol(problem, n_samples, residuos_kg_dia, umidade, anos_simulacao):
+    param_values = gerar_amostras_saltelli(problem, n_samples)
+    lotes = np.array_split(param_values, min(len(param_values), 4 * cpu_count()))
+    resultados = Parallel(n_jobs=-1, prefer="threads")(
+        delayed(executar_lote_sobol)(lote, residuos_kg_dia, umidade, anos_simulacao)
+        for lote in lotes
+    )
+    return np.concatenate(resultados)
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def calcular_indices_sobol(problem, n_samples, emissoes_projeto_t, residuos_kg_dia, umidade, anos_simulacao):
+    from SALib.analyze.sobol import analyze
+    
+    emissoes_aterro_t = avaliar_aterro_sobol(problem, n_samples, residuos_kg_dia, umidade, anos_simulacao)
+    Si = analyze(problem, emissoes_aterro_t - emissoes_projeto_t, print_to_console=False, seed=50)
+    
+    return Si['S1'], Si['ST']
+
+def gerar_parametros_mc(n, seed=50):
+    rng = np.random.RandomState(seed)
+    umidade_vals = rng.uniform(0.75, 0.90, n)
+    temp_vals = rng.normal(25, 3, n)
+    doc_vals = rng.triangular(0.12, 0.15, 0.18, n)
+    
+    return umidade_vals, temp_vals, doc_vals
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def simular_monte_carlo(n_simulations, residuos_kg_dia, k_ano, anos_simulacao):
+    umidade_vals, temp_vals, doc_vals = gerar_parametros_mc(n_simulations)
+    
+    results_mc = GHGEmissionCalculator().calculate_avoided_emissions_batch(
+        waste_kg_day=residuos_kg_dia,
+        k_year=k_ano,
+        temperature_C=temp_vals,
+        doc_fraction=doc_vals,
+        moisture_fraction=umidade_vals,
+        years=anos_simulacao
+    )
+    
+    return results_mc['vermicomposting']['avoided_co2eq_t'], results_mc['thermophilic']['avoided_co2eq_t']
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def comparar_monte_carlo(results_tese, results_unfccc):
+    from scipy import stats
+    
+    _, p_valor_normalidade_diff = stats.normaltest(results_tese - results_unfccc)
+    ttest_pareado, p_ttest_pareado = stats.ttest_rel(results_tese, results_unfccc)
+    wilcoxon_stat, p_wilcoxon = stats.wilcoxon(results_tese, results_unfccc)
     
-    return results['vermicomposting']['avoided_co2eq_t']
+    return p_valor_normalidade_diff, ttest_pareado, p_ttest_pareado, wilcoxon_stat, p_wilcoxon
 
-def executar_simulacao_unfccc_sobol(params_sobol):
-    k_ano_sobol, T_sobol, DOC_sobol = params_sobol
+def gerar_amostras_saltelli(problem, n, seed=50):
+    from scipy.stats import qmc
+    
+    d = problem['num_vars']
+    base = qmc.Sobol(d=2 * d, scramble=True, seed=seed).random(n)
+    A, B = base[:, :d], base[:, d:]
     
-    np.random.seed(50)
+    # Mesmo layout de SALib.sample.sobol.sample: A, AB_1..AB_d, BA_1..BA_d, B
+    blocos = np.empty((n, 2 * d + 2, d))
+    blocos[:, 0] = A
+    blocos[:, 1:d + 1] = A[:, None, :]
+    blocos[:, d + 1:2 * d + 1] = B[:, None, :]
+    diagonal = np.arange(d)
+    blocos[:, 1 + diagonal, diagonal] = B
+    blocos[:, d + 1 + diagonal, diagonal] = A
+    blocos[:, -1] = B
     
+    bounds = np.asarray(problem['bounds'], dtype=float)
+    return qmc.scale(blocos.reshape(-1, d), bounds[:, 0], bounds[:, 1])
+
+@st.cache_resource
+def configurar_graficos():
+    import seaborn as sns
+    plt.rcParams['figure.dpi'] = 150
+    plt.rcParams['font.size'] = 10
+    sns.set_style("whitegrid")
+
+@st.cache_data(show_spinner=False)
+def gerar_eixo_datas(data_inicio, dias):
+    return pd.date_range(start=data_inicio, periods=dias, freq='D')
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def calcular_cenarios_emissoes(residuos_kg_dia, k_ano, T, DOC, umidade, anos_simulacao, data_inicio):
     calculator = GHGEmissionCalculator()
     
     results = calculator.calculate_avoided_emissions(
         waste_kg_day=residuos_kg_dia,
-        k_year=k_ano_sobol,
-        temperature_C=T_sobol,
-        doc_fraction=DOC_sobol,
+        k_year=k_ano,
+        temperature_C=T,
+        doc_fraction=DOC,
         moisture_fraction=umidade,
         years=anos_simulacao
     )
     
-    return results['thermophilic']['avoided_co2eq_t']
+    dias = anos_simulacao * 365
+    datas = gerar_eixo_datas(data_inicio, dias)
+    
+    ch4_aterro_dia, n2o_aterro_dia = results['baseline']['ch4_daily'], results['baseline']['n2o_daily']
+    ch4_vermi_dia, n2o_vermi_dia = results['vermicomposting']['ch4_daily'], results['vermicomposting']['n2o_daily']
+    
+    emissoes_kg_dia = np.column_stack([ch4_aterro_dia, n2o_aterro_dia, ch4_vermi_dia, n2o_vermi_dia])
+    emissoes_tco2eq_dia = emissoes_kg_dia * (np.array([calculator.GWP_CH4_20, calculator.GWP_N2O_20] * 2) / 1000)
+    totais_tco2eq_dia = emissoes_tco2eq_dia.reshape(dias, 2, 2).sum(axis=2)
+    totais_tco2eq_acum = np.cumsum(totais_tco2eq_dia, axis=0)
+    
+    df = pd.DataFrame({
+        'Data': datas,
+        'Total_Aterro_tCO2eq_acum': totais_tco2eq_acum[:, 0],
+        'Total_Vermi_tCO2eq_acum': totais_tco2eq_acum[:, 1],
+    })
+    
+    total_compost_unfccc_tco2eq_dia = calculator._co2eq_t(
+        results['thermophilic']['ch4_daily'], results['thermophilic']['n2o_daily']
+    )
+    
+    anos_dia = datas.year.to_numpy()
+    inicio_anos = np.flatnonzero(np.diff(anos_dia, prepend=anos_dia[0] - 1))
+    totais_anuais = np.add.reduceat(
+        np.column_stack([totais_tco2eq_dia, total_compost_unfccc_tco2eq_dia]), inicio_anos, axis=0
+    )
+    anos = anos_dia[inicio_anos]
+    reducoes_anuais = totais_anuais[:, [0]] - totais_anuais[:, 1:]
+    reducoes_acum = np.cumsum(reducoes_anuais, axis=0)
+    
+    df_anual_revisado = pd.DataFrame({
+        'Year': anos,
+        'Baseline emissions (t CO₂eq)': totais_anuais[:, 0],
+        'Project emissions (t CO₂eq)': totais_anuais[:, 1],
+        'Emission reductions (t CO₂eq)': reducoes_anuais[:, 0],
+        'Cumulative reduction (t CO₂eq)': reducoes_acum[:, 0],
+    })
+    
+    df_comp_anual_revisado = pd.DataFrame({
+        'Year': anos,
+        'Project emissions (t CO₂eq)': totais_anuais[:, 2],
+        'Baseline emissions (t CO₂eq)': totais_anuais[:, 0],
+        'Emission reductions (t CO₂eq)': reducoes_anuais[:, 1],
+        'Cumulative reduction (t CO₂eq)': reducoes_acum[:, 1],
+    })
+    
+    return results, df, df_anual_revisado, df_comp_anual_revisado
+
+def nova_figura(figsize=(10, 6)):
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots()
+
+def figura_para_png(fig):
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', bbox_inches='tight')
+    return buffer.getvalue()
 
-def gerar_parametros_mc(n):
-    np.random.seed(50)
-    umidade_vals = np.random.uniform(0.75, 0.90, n)
-    temp_vals = np.random.normal(25, 3, n)
-    doc_vals = np.random.triangular(0.12, 0.15, 0.18, n)
+@st.cache_data(max_entries=8, show_spinner=False)
+def grafico_evitadas_anual(df_evitadas_anual):
+    fig, ax = nova_figura()
+    x = np.arange(len(df_evitadas_anual['Year']))
+    bar_width = 0.35
+
+    barras_tese = ax.bar(x - bar_width/2, df_evitadas_anual['Proposta da Tese'], width=bar_width,
+            label='Proposta da Tese', edgecolor='black')
+    barras_unfccc = ax.bar(x + bar_width/2, df_evitadas_anual['UNFCCC (2012)'], width=bar_width,
+            label='UNFCCC (2012)', edgecolor='black', hatch='//')
+
+    for barras in (barras_tese, barras_unfccc):
+        ax.bar_label(barras, fmt=formatar_br, padding=2, fontsize=9, fontweight='bold')
+
+    ax.set_xlabel('Ano')
+    ax.set_ylabel('Emissões Evitadas (t CO₂eq)')
+    ax.set_title('Comparação Anual das Emissões Evitadas: Proposta da Tese vs UNFCCC (2012)')
     
-    return umidade_vals, temp_vals, doc_vals
+    ax.set_xticks(x)
+    ax.set_xticklabels(df_evitadas_anual['Year'], fontsize=8)
+
+    ax.legend(title='Metodologia')
+    ax.yaxis.set_major_formatter(BR_FORMATTER)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    return figura_para_png(fig)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def grafico_reducao_acumulada(df, anos_simulacao, k_ano):
+    passo = max(1, len(df) // 2000)
+    indices = np.unique(np.r_[np.arange(0, len(df), passo), len(df) - 1])
+    datas = df['Data'].to_numpy()[indices]
+    aterro_acum = df['Total_Aterro_tCO2eq_acum'].to_numpy()[indices]
+    vermi_acum = df['Total_Vermi_tCO2eq_acum'].to_numpy()[indices]
+    
+    fig, ax = nova_figura()
+    ax.plot(datas, aterro_acum, 'r-', label='Cenário Base (Aterro Sanitário)', linewidth=2)
+    ax.plot(datas, vermi_acum, 'g-', label='Projeto (Compostagem em reatores com minhocas)', linewidth=2)
+    ax.fill_between(datas, vermi_acum, aterro_acum,
+                    color='skyblue', alpha=0.5, label='Emissões Evitadas')
+    ax.set_title('Redução de Emissões em {} Anos (k = {} ano⁻¹)'.format(anos_simulacao, formatar_br(k_ano)))
+    ax.set_xlabel('Ano')
+    ax.set_ylabel('tCO₂eq Acumulado')
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.yaxis.set_major_formatter(BR_FORMATTER)
+    return figura_para_png(fig)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def grafico_sensibilidade(sensibilidade_df, titulo):
+    import seaborn as sns
+    
+    fig, ax = nova_figura()
+    sns.barplot(x='ST', y='Parâmetro', data=sensibilidade_df, palette='viridis', ax=ax)
+    ax.set_title(titulo)
+    ax.set_xlabel('Índice ST (Sobol Total)')
+    ax.set_ylabel('Parâmetro')
+    ax.grid(axis='x', linestyle='--', alpha=0.7)
+    ax.xaxis.set_major_formatter(BR_FORMATTER)
+    
+    for barras in ax.containers:
+        ax.bar_label(barras, fmt=lambda st_value: f' {formatar_br(st_value)}', fontweight='bold')
+    
+    return figura_para_png(fig)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def grafico_monte_carlo(resultados, media, intervalo_95, cor, titulo):
+    from scipy.stats import gaussian_kde
+    
+    contagens, bordas = np.histogram(resultados, bins=30)
+    grade = np.linspace(bordas[0], bordas[-1], 200)
+    densidade = gaussian_kde(resultados)(grade) * contagens.sum() * (bordas[1] - bordas[0])
+    
+    fig, ax = nova_figura()
+    ax.stairs(contagens, bordas, fill=True, color=cor, alpha=0.6)
+    ax.plot(grade, densidade, color=cor, linewidth=2)
+    ax.axvline(media, color='red', linestyle='--', label=f'Média: {formatar_br(media)} tCO₂eq')
+    ax.axvline(intervalo_95[0], color='green', linestyle=':', label='IC 95%')
+    ax.axvline(intervalo_95[1], color='green', linestyle=':')
+    ax.set_title(titulo)
+    ax.set_xlabel('Emissões Evitadas (tCO₂eq)')
+    ax.set_ylabel('Frequência')
+    ax.legend()
+    ax.grid(alpha=0.3)
+    ax.xaxis.set_major_formatter(BR_FORMATTER)
+    return figura_para_png(fig)
 
 if st.session_state.get('run_simulation', False):
     with st.spinner('Executando simulação...'):
-        calculator = GHGEmissionCalculator()
+        configurar_graficos()
         k_ano = st.session_state.k_ano
         
-        results = calculator.calculate_avoided_emissions(
-            waste_kg_day=residuos_kg_dia,
-            k_year=k_ano,
-            temperature_C=T,
-            doc_fraction=DOC,
-            moisture_fraction=umidade,
-            years=anos_simulacao
+        results, df, df_anual_revisado, df_comp_anual_revisado = calcular_cenarios_emissoes(
+            residuos_kg_dia, k_ano, T, DOC, umidade, anos_simulacao, datetime.now().date()
         )
         
-        dias = anos_simulacao * 365
-        datas = pd.date_range(start=datetime.now(), periods=dias, freq='D')
-        
-        ch4_aterro_dia, n2o_aterro_dia = calculator.calculate_landfill_emissions(
-            residuos_kg_dia, k_ano, T, DOC, umidade, anos_simulacao
-        )
-        
-        ch4_vermi_dia, n2o_vermi_dia = calculator.calculate_vermicomposting_emissions(
-            residuos_kg_dia, umidade, anos_simulacao
-        )
-        
-        df = pd.DataFrame({
-            'Data': datas,
-            'CH4_Aterro_kg_dia': ch4_aterro_dia,
-            'N2O_Aterro_kg_dia': n2o_aterro_dia,
-            'CH4_Vermi_kg_dia': ch4_vermi_dia,
-            'N2O_Vermi_kg_dia': n2o_vermi_dia,
-        })
-        
-        for gas in ['CH4_Aterro', 'N2O_Aterro', 'CH4_Vermi', 'N2O_Vermi']:
-            df[f'{gas}_tCO2eq'] = df[f'{gas}_kg_dia'] * (calculator.GWP_CH4_20 if 'CH4' in gas else calculator.GWP_N2O_20) / 1000
-        
-        df['Total_Aterro_tCO2eq_dia'] = df['CH4_Aterro_tCO2eq'] + df['N2O_Aterro_tCO2eq']
-        df['Total_Vermi_tCO2eq_dia'] = df['CH4_Vermi_tCO2eq'] + df['N2O_Vermi_tCO2eq']
-        
-        df['Total_Aterro_tCO2eq_acum'] = df['Total_Aterro_tCO2eq_dia'].cumsum()
-        df['Total_Vermi_tCO2eq_acum'] = df['Total_Vermi_tCO2eq_dia'].cumsum()
-        df['Reducao_tCO2eq_acum'] = df['Total_Aterro_tCO2eq_acum'] - df['Total_Vermi_tCO2eq_acum']
-        
-        df['Year'] = df['Data'].dt.year
-        df_anual_revisado = df.groupby('Year').agg({
-            'Total_Aterro_tCO2eq_dia': 'sum',
-            'Total_Vermi_tCO2eq_dia': 'sum',
-        }).reset_index()
-        
-        df_anual_revisado['Emission reductions (t CO₂eq)'] = df_anual_revisado['Total_Aterro_tCO2eq_dia'] - df_anual_revisado['Total_Vermi_tCO2eq_dia']
-        df_anual_revisado['Cumulative reduction (t CO₂eq)'] = df_anual_revisado['Emission reductions (t CO₂eq)'].cumsum()
-        
-        df_anual_revisado.rename(columns={
-            'Total_Aterro_tCO2eq_dia': 'Baseline emissions (t CO₂eq)',
-            'Total_Vermi_tCO2eq_dia': 'Project emissions (t CO₂eq)',
-        }, inplace=True)
-        
-        ch4_compost_dia, n2o_compost_dia = calculator.calculate_thermophilic_emissions(
-            residuos_kg_dia, umidade, anos_simulacao
-        )
-        
-        ch4_compost_unfccc_tco2eq = ch4_compost_dia * calculator.GWP_CH4_20 / 1000
-        n2o_compost_unfccc_tco2eq = n2o_compost_dia * calculator.GWP_N2O_20 / 1000
-        total_compost_unfccc_tco2eq_dia = ch4_compost_unfccc_tco2eq + n2o_compost_unfccc_tco2eq
-        
-        df_comp_unfccc_dia = pd.DataFrame({
-            'Data': datas,
-            'Total_Compost_tCO2eq_dia': total_compost_unfccc_tco2eq_dia
-        })
-        df_comp_unfccc_dia['Year'] = df_comp_unfccc_dia['Data'].dt.year
-        
-        df_comp_anual_revisado = df_comp_unfccc_dia.groupby('Year').agg({
-            'Total_Compost_tCO2eq_dia': 'sum'
-        }).reset_index()
-        
-        df_comp_anual_revisado = pd.merge(df_comp_anual_revisado,
-                                          df_anual_revisado[['Year', 'Baseline emissions (t CO₂eq)']],
-                                          on='Year', how='left')
-        
-        df_comp_anual_revisado['Emission reductions (t CO₂eq)'] = df_comp_anual_revisado['Baseline emissions (t CO₂eq)'] - df_comp_anual_revisado['Total_Compost_tCO2eq_dia']
-        df_comp_anual_revisado['Cumulative reduction (t CO₂eq)'] = df_comp_anual_revisado['Emission reductions (t CO₂eq)'].cumsum()
-        df_comp_anual_revisado.rename(columns={'Total_Compost_tCO2eq_dia': 'Project emissions (t CO₂eq)'}, inplace=True)
-        
         st.header("📈 Resultados da Simulação")
         
         st.info(f"""
@@ -784,57 +1058,17 @@ if st.session_state.get('run_simulation', False):
             'UNFCCC (2012)': df_comp_anual_revisado['Emission reductions (t CO₂eq)']
         })
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        br_formatter = FuncFormatter(br_format)
-        x = np.arange(len(df_evitadas_anual['Year']))
-        bar_width = 0.35
-
-        ax.bar(x - bar_width/2, df_evitadas_anual['Proposta da Tese'], width=bar_width,
-                label='Proposta da Tese', edgecolor='black')
-        ax.bar(x + bar_width/2, df_evitadas_anual['UNFCCC (2012)'], width=bar_width,
-                label='UNFCCC (2012)', edgecolor='black', hatch='//')
-
-        for i, (v1, v2) in enumerate(zip(df_evitadas_anual['Proposta da Tese'], 
-                                         df_evitadas_anual['UNFCCC (2012)'])):
-            ax.text(i - bar_width/2, v1 + max(v1, v2)*0.01, 
-                    formatar_br(v1), ha='center', fontsize=9, fontweight='bold')
-            ax.text(i + bar_width/2, v2 + max(v1, v2)*0.01, 
-                    formatar_br(v2), ha='center', fontsize=9, fontweight='bold')
-
-        ax.set_xlabel('Ano')
-        ax.set_ylabel('Emissões Evitadas (t CO₂eq)')
-        ax.set_title('Comparação Anual das Emissões Evitadas: Proposta da Tese vs UNFCCC (2012)')
-        
-        ax.set_xticks(x)
-        ax.set_xticklabels(df_anual_revisado['Year'], fontsize=8)
-
-        ax.legend(title='Metodologia')
-        ax.yaxis.set_major_formatter(br_formatter)
-        ax.grid(axis='y', linestyle='--', alpha=0.7)
-        st.pyplot(fig)
+        st.image(grafico_evitadas_anual(df_evitadas_anual))
 
         st.subheader("📉 Redução de Emissões Acumulada")
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.plot(df['Data'], df['Total_Aterro_tCO2eq_acum'], 'r-', label='Cenário Base (Aterro Sanitário)', linewidth=2)
-        ax.plot(df['Data'], df['Total_Vermi_tCO2eq_acum'], 'g-', label='Projeto (Compostagem em reatores com minhocas)', linewidth=2)
-        ax.fill_between(df['Data'], df['Total_Vermi_tCO2eq_acum'], df['Total_Aterro_tCO2eq_acum'],
-                        color='skyblue', alpha=0.5, label='Emissões Evitadas')
-        ax.set_title('Redução de Emissões em {} Anos (k = {} ano⁻¹)'.format(anos_simulacao, formatar_br(k_ano)))
-        ax.set_xlabel('Ano')
-        ax.set_ylabel('tCO₂eq Acumulado')
-        ax.legend()
-        ax.grid(True, linestyle='--', alpha=0.7)
-        ax.yaxis.set_major_formatter(br_formatter)
-
-        st.pyplot(fig)
+        st.image(grafico_reducao_acumulada(
+            df, anos_simulacao, k_ano
+        ))
 
         st.subheader("🎯 Análise de Sensibilidade Global (Sobol) - Proposta da Tese")
         st.info("**Parâmetros variados na análise:** Taxa de Decaimento (k), Temperatura (T), DOC")
-        br_formatter_sobol = FuncFormatter(br_format)
-
-        np.random.seed(50)  
         
-        problem_tese = {
+        problem_sobol = {
             'num_vars': 3,
             'names': ['taxa_decaimento', 'T', 'DOC'],
             'bounds': [
@@ -844,14 +1078,15 @@ if st.session_state.get('run_simulation', False):
             ]
         }
 
-        param_values_tese = sample(problem_tese, n_samples, seed=50)
-        results_tese = Parallel(n_jobs=-1)(delayed(executar_simulacao_completa_sobol)(params) for params in param_values_tese)
-        Si_tese = analyze(problem_tese, np.array(results_tese), print_to_console=False)
+        S1_tese, ST_tese = calcular_indices_sobol(
+            problem_sobol, n_samples, results['vermicomposting']['co2eq_t'],
+            residuos_kg_dia, umidade, anos_simulacao
+        )
         
         sensibilidade_df_tese = pd.DataFrame({
-            'Parâmetro': problem_tese['names'],
-            'S1': Si_tese['S1'],
-            'ST': Si_tese['ST']
+            'Parâmetro': problem_sobol['names'],
+            'S1': S1_tese,
+            'ST': ST_tese
         }).sort_values('ST', ascending=False)
 
         nomes_amigaveis = {
@@ -861,18 +1096,7 @@ if st.session_state.get('run_simulation', False):
         }
         sensibilidade_df_tese['Parâmetro'] = sensibilidade_df_tese['Parâmetro'].map(nomes_amigaveis)
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.barplot(x='ST', y='Parâmetro', data=sensibilidade_df_tese, palette='viridis', ax=ax)
-        ax.set_title('Sensibilidade Global - Proposta da Tese')
-        ax.set_xlabel('Índice ST (Sobol Total)')
-        ax.set_ylabel('Parâmetro')
-        ax.grid(axis='x', linestyle='--', alpha=0.7)
-        ax.xaxis.set_major_formatter(br_formatter_sobol)
-        
-        for i, (st_value) in enumerate(sensibilidade_df_tese['ST']):
-            ax.text(st_value, i, f' {formatar_br(st_value)}', va='center', fontweight='bold')
-        
-        st.pyplot(fig)
+        st.image(grafico_sensibilidade(sensibilidade_df_tese, 'Sensibilidade Global - Proposta da Tese'))
         
         st.subheader("📊 Valores de Sensibilidade - Proposta da Tese")
         st.dataframe(sensibilidade_df_tese.style.format({
@@ -882,43 +1106,21 @@ if st.session_state.get('run_simulation', False):
 
         st.subheader("🎯 Análise de Sensibilidade Global (Sobol) - Cenário UNFCCC")
         st.info("**Parâmetros variados na análise:** Taxa de Decaimento (k), Temperatura (T), DOC")
-
-        np.random.seed(50)
         
-        problem_unfccc = {
-            'num_vars': 3,
-            'names': ['taxa_decaimento', 'T', 'DOC'],
-            'bounds': [
-                [0.06, 0.40],
-                [20.0, 40.0],
-                [0.10, 0.25],
-            ]
-        }
-
-        param_values_unfccc = sample(problem_unfccc, n_samples, seed=50)
-        results_unfccc = Parallel(n_jobs=-1)(delayed(executar_simulacao_unfccc_sobol)(params) for params in param_values_unfccc)
-        Si_unfccc = analyze(problem_unfccc, np.array(results_unfccc), print_to_console=False)
+        S1_unfccc, ST_unfccc = calcular_indices_sobol(
+            problem_sobol, n_samples, results['thermophilic']['co2eq_t'],
+            residuos_kg_dia, umidade, anos_simulacao
+        )
         
         sensibilidade_df_unfccc = pd.DataFrame({
-            'Parâmetro': problem_unfccc['names'],
-            'S1': Si_unfccc['S1'],
-            'ST': Si_unfccc['ST']
+            'Parâmetro': problem_sobol['names'],
+            'S1': S1_unfccc,
+            'ST': ST_unfccc
         }).sort_values('ST', ascending=False)
 
         sensibilidade_df_unfccc['Parâmetro'] = sensibilidade_df_unfccc['Parâmetro'].map(nomes_amigaveis)
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.barplot(x='ST', y='Parâmetro', data=sensibilidade_df_unfccc, palette='viridis', ax=ax)
-        ax.set_title('Sensibilidade Global - Cenário UNFCCC')
-        ax.set_xlabel('Índice ST (Sobol Total)')
-        ax.set_ylabel('Parâmetro')
-        ax.grid(axis='x', linestyle='--', alpha=0.7)
-        ax.xaxis.set_major_formatter(br_formatter_sobol)
-        
-        for i, (st_value) in enumerate(sensibilidade_df_unfccc['ST']):
-            ax.text(st_value, i, f' {formatar_br(st_value)}', va='center', fontweight='bold')
-        
-        st.pyplot(fig)
+        st.image(grafico_sensibilidade(sensibilidade_df_unfccc, 'Sensibilidade Global - Cenário UNFCCC'))
         
         st.subheader("📊 Valores de Sensibilidade - Cenário UNFCCC")
         st.dataframe(sensibilidade_df_unfccc.style.format({
@@ -928,99 +1130,49 @@ if st.session_state.get('run_simulation', False):
 
         st.subheader("🎲 Análise de Incerteza (Monte Carlo) - Proposta da Tese")
         
-        umidade_vals, temp_vals, doc_vals = gerar_parametros_mc(n_simulations)
-        
-        results_mc_tese = []
-        for i in range(n_simulations):
-            calculator_mc = GHGEmissionCalculator()
-            results_mc = calculator_mc.calculate_avoided_emissions(
-                waste_kg_day=residuos_kg_dia,
-                k_year=k_ano,
-                temperature_C=temp_vals[i],
-                doc_fraction=doc_vals[i],
-                moisture_fraction=umidade_vals[i],
-                years=anos_simulacao
-            )
-            results_mc_tese.append(results_mc['vermicomposting']['avoided_co2eq_t'])
+        results_array_tese, results_array_unfccc = simular_monte_carlo(
+            n_simulations, residuos_kg_dia, k_ano, anos_simulacao
+        )
 
-        results_array_tese = np.array(results_mc_tese)
         media_tese = np.mean(results_array_tese)
         intervalo_95_tese = np.percentile(results_array_tese, [2.5, 97.5])
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.histplot(results_array_tese, kde=True, bins=30, color='skyblue', ax=ax)
-        ax.axvline(media_tese, color='red', linestyle='--', label=f'Média: {formatar_br(media_tese)} tCO₂eq')
-        ax.axvline(intervalo_95_tese[0], color='green', linestyle=':', label='IC 95%')
-        ax.axvline(intervalo_95_tese[1], color='green', linestyle=':')
-        ax.set_title('Distribuição das Emissões Evitadas (Simulação Monte Carlo) - Proposta da Tese (k = {} ano⁻¹)'.format(formatar_br(k_ano)))
-        ax.set_xlabel('Emissões Evitadas (tCO₂eq)')
-        ax.set_ylabel('Frequência')
-        ax.legend()
-        ax.grid(alpha=0.3)
-        ax.xaxis.set_major_formatter(br_formatter)
-        st.pyplot(fig)
+        st.image(grafico_monte_carlo(
+            results_array_tese, media_tese, intervalo_95_tese, 'skyblue',
+            'Distribuição das Emissões Evitadas (Simulação Monte Carlo) - Proposta da Tese (k = {} ano⁻¹)'.format(formatar_br(k_ano))
+        ))
 
         st.subheader("🎲 Análise de Incerteza (Monte Carlo) - Cenário UNFCCC")
         
-        results_mc_unfccc = []
-        for i in range(n_simulations):
-            calculator_mc = GHGEmissionCalculator()
-            results_mc = calculator_mc.calculate_avoided_emissions(
-                waste_kg_day=residuos_kg_dia,
-                k_year=k_ano,
-                temperature_C=temp_vals[i],
-                doc_fraction=doc_vals[i],
-                moisture_fraction=umidade_vals[i],
-                years=anos_simulacao
-            )
-            results_mc_unfccc.append(results_mc['thermophilic']['avoided_co2eq_t'])
-
-        results_array_unfccc = np.array(results_mc_unfccc)
         media_unfccc = np.mean(results_array_unfccc)
         intervalo_95_unfccc = np.percentile(results_array_unfccc, [2.5, 97.5])
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.histplot(results_array_unfccc, kde=True, bins=30, color='coral', ax=ax)
-        ax.axvline(media_unfccc, color='red', linestyle='--', label=f'Média: {formatar_br(media_unfccc)} tCO₂eq')
-        ax.axvline(intervalo_95_unfccc[0], color='green', linestyle=':', label='IC 95%')
-        ax.axvline(intervalo_95_unfccc[1], color='green', linestyle=':')
-        ax.set_title('Distribuição das Emissões Evitadas (Simulação Monte Carlo) - Cenário UNFCCC (k = {} ano⁻¹)'.format(formatar_br(k_ano)))
-        ax.set_xlabel('Emissões Evitadas (tCO₂eq)')
-        ax.set_ylabel('Frequência')
-        ax.legend()
-        ax.grid(alpha=0.3)
-        ax.xaxis.set_major_formatter(br_formatter)
-        st.pyplot(fig)
+        st.image(grafico_monte_carlo(
+            results_array_unfccc, media_unfccc, intervalo_95_unfccc, 'coral',
+            'Distribuição das Emissões Evitadas (Simulação Monte Carlo) - Cenário UNFCCC (k = {} ano⁻¹)'.format(formatar_br(k_ano))
+        ))
 
         st.subheader("📊 Análise Estatística de Comparação")
         
-        diferencas = results_array_tese - results_array_unfccc
-        _, p_valor_normalidade_diff = stats.normaltest(diferencas)
+        (p_valor_normalidade_diff, ttest_pareado, p_ttest_pareado,
+         wilcoxon_stat, p_wilcoxon) = comparar_monte_carlo(results_array_tese, results_array_unfccc)
         st.write(f"Teste de normalidade das diferenças (p-value): **{formatar_br_dec(p_valor_normalidade_diff, 5)}**")
 
-        ttest_pareado, p_ttest_pareado = stats.ttest_rel(results_array_tese, results_array_unfccc)
         st.write(f"Teste T pareado: Estatística t = **{formatar_br_dec(ttest_pareado, 5)}**, P-valor = **{formatar_br_dec(p_ttest_pareado, 5)}**")
 
-        wilcoxon_stat, p_wilcoxon = stats.wilcoxon(results_array_tese, results_array_unfccc)
         st.write(f"Teste de Wilcoxon (pareado): Estatística = **{formatar_br_dec(wilcoxon_stat, 5)}**, P-valor = **{formatar_br_dec(p_wilcoxon, 5)}**")
 
         st.subheader("📋 Resultados Anuais - Proposta da Tese")
 
-        df_anual_formatado = df_anual_revisado.copy()
-        for col in df_anual_formatado.columns:
-            if col != 'Year':
-                df_anual_formatado[col] = df_anual_formatado[col].apply(formatar_br)
-
-        st.dataframe(df_anual_formatado)
+        st.dataframe(df_anual_revisado.style.format(
+            {col: formatar_br for col in df_anual_revisado.columns if col != 'Year'}
+        ))
 
         st.subheader("📋 Resultados Anuais - Metodologia UNFCCC")
 
-        df_comp_formatado = df_comp_anual_revisado.copy()
-        for col in df_comp_formatado.columns:
-            if col != 'Year':
-                df_comp_formatado[col] = df_comp_formatado[col].apply(formatar_br)
-
-        st.dataframe(df_comp_formatado)
+        st.dataframe(df_comp_anual_revisado.style.format(
+            {col: formatar_br for col in df_comp_anual_revisado.columns if col != 'Year'}
+        ))
 
 else:
     st.info("💡 Ajuste os parâmetros na barra lateral e clique em 'Executar Simulação' para ver os resultados.")